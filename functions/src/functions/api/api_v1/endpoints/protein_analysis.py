@@ -1,12 +1,26 @@
-from fastapi import APIRouter, Depends, status
+from typing import Iterator
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from functions.api.deps import get_current_user
+from functions.api.ingestion import parse_analysis_request
 from functions.schemas.api import ErrorResponse
 from functions.schemas.protein_analysis import (
+    ClusteringRequest,
+    ClusteringResponse,
     ProteinAnalysisRequest,
     ProteinAnalysisResponse,
+    VariantScanRequest,
+    VariantScanResponse,
+)
+from functions.services.protein_analysis import (
+    analyze_protein_sequences,
+    analyze_protein_variants,
+    cluster_protein_sequences,
+    stream_protein_sequences,
 )
-from functions.services.protein_analysis import analyze_protein_sequences
+from functions.services.protein_analyzers import ProteinAnalysisFactory
 
 router = APIRouter()
 
@@ -30,6 +44,149 @@ def run_analysis(
     Supports both basic and advanced analysis types.
     """
     results = analyze_protein_sequences(
-        analysis_request.sequences, analysis_request.analysis_type
+        analysis_request.sequences,
+        analysis_request.analysis_type,
+        analysis_request.digestion,
     )
     return ProteinAnalysisResponse(results=results)
+
+
+@router.post(
+    "/bulk",
+    response_model=ProteinAnalysisResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": "#/components/schemas/ProteinAnalysisRequest"}
+                }
+            },
+        }
+    },
+)
+def run_bulk_analysis(
+    *,
+    # Authenticate before the body is read or parsed
+    current_user_id: str = Depends(get_current_user),
+    analysis_request: ProteinAnalysisRequest = Depends(parse_analysis_request),
+):
+    """
+    Run protein analysis on a large list of sequences.
+    Accepts the same body as the regular endpoint, but parses it on a fast path
+    that enforces size and sequence-count limits before analysis.
+    """
+    results = analyze_protein_sequences(
+        analysis_request.sequences,
+        analysis_request.analysis_type,
+        analysis_request.digestion,
+    )
+    return ProteinAnalysisResponse(results=results)
+
+
+@router.post(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "One ProteinAnalysisResult JSON object per line",
+        },
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+    },
+)
+def run_analysis_stream(
+    *,
+    analysis_request: ProteinAnalysisRequest,
+    current_user_id: str = Depends(get_current_user),
+):
+    """
+    Run protein analysis on a list of sequences, streaming newline-delimited JSON.
+    Each line holds one result with unset fields omitted. If a sequence fails,
+    an error object is written as the last line.
+    """
+    if (
+        analysis_request.analysis_type.lower()
+        not in ProteinAnalysisFactory.get_supported_types()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported analysis type: {analysis_request.analysis_type}",
+        )
+
+    def generate_lines() -> Iterator[str]:
+        results = stream_protein_sequences(
+            analysis_request.sequences,
+            analysis_request.analysis_type,
+            analysis_request.digestion,
+        )
+        try:
+            for result in results:
+                yield result.model_dump_json(exclude_none=True) + "\n"
+        except ValueError as exc:
+            yield ErrorResponse(detail=str(exc)).model_dump_json() + "\n"
+
+    return StreamingResponse(generate_lines(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/clusters",
+    response_model=ClusteringResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+    },
+)
+def run_clustering(
+    *,
+    clustering_request: ClusteringRequest,
+    current_user_id: str = Depends(get_current_user),
+):
+    """
+    Cluster near-duplicate sequences at an identity threshold.
+    Optionally runs the analysis on cluster representatives only.
+    """
+    try:
+        return cluster_protein_sequences(
+            clustering_request.sequences,
+            clustering_request.clustering,
+            clustering_request.analysis_type,
+            clustering_request.digestion,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+@router.post(
+    "/variants",
+    response_model=VariantScanResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"model": ErrorResponse},
+        401: {"model": ErrorResponse},
+    },
+)
+def run_variant_scan(
+    *,
+    scan_request: VariantScanRequest,
+    current_user_id: str = Depends(get_current_user),
+):
+    """
+    Run a mutational scan of a parent sequence.
+    The parent is analyzed once and each variant is derived from it.
+    """
+    try:
+        return analyze_protein_variants(
+            scan_request.parent_sequence, scan_request.variants
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
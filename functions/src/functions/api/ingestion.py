@@ -0,0 +1,196 @@
+import email.message
+import functools
+import json
+import re
+from typing import Any, Optional
+
+import orjson
+from fastapi import HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from functions.core.config import settings
+from functions.schemas.protein_analysis import (
+    DigestionParameters,
+    ProteinAnalysisRequest,
+)
+
+# A JSON string or other scalar token; atomic groups keep failed matches linear
+_JSON_SCALAR = rb'(?>"(?:[^"\\]|\\.)*+"|[^\s\[\]{},:"]++)'
+_SEQUENCES_ARRAY = re.compile(rb'"sequences"\s*:\s*\[')
+
+
+@functools.lru_cache(maxsize=4)
+def _more_items_than(limit: int) -> re.Pattern:
+    """Pattern matching the start of an array with more than limit scalar items."""
+    return re.compile(rb"(?:\s*%s\s*,){%d}\s*%s" % (_JSON_SCALAR, limit, _JSON_SCALAR))
+
+
+def _exceeds_sequence_limit(body: bytearray, limit: int) -> bool:
+    """
+    Check whether the raw body holds more than limit sequences, without decoding.
+
+    An array of n items needs n - 1 commas, so most bodies are cleared by a
+    single count. Otherwise only the first limit + 1 items of the sequences
+    array are matched in place. Items that are nested containers stop the
+    match and are left to the check after decoding.
+    """
+    if body.count(b",") < limit:
+        return False
+    array = _SEQUENCES_ARRAY.search(body)
+    return array is not None and bool(_more_items_than(limit).match(body, array.end()))
+
+
+def _too_many_sequences() -> HTTPException:
+    limit = settings.MAX_SEQUENCES_PER_REQUEST
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Request contains more than the limit of {limit} sequences",
+    )
+
+
+async def read_body_with_limit(request: Request, max_bytes: int) -> bytearray:
+    """
+    Read the request body, rejecting it as soon as it exceeds max_bytes.
+
+    A declared Content-Length is checked before anything is read, and the
+    streamed size is checked as chunks arrive, so oversized bodies are never
+    fully buffered.
+    """
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Request body exceeds the limit of {max_bytes} bytes",
+    )
+
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise too_large
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_bytes:
+            raise too_large
+    return body
+
+
+def _is_json_content_type(content_type: Optional[str]) -> bool:
+    """Match FastAPI's rule for which bodies are decoded as JSON."""
+    if not content_type:
+        return True
+    message = email.message.Message()
+    message["content-type"] = content_type
+    if message.get_content_maintype() != "application":
+        return False
+    subtype = message.get_content_subtype()
+    return subtype == "json" or subtype.endswith("+json")
+
+
+def _decode_slowly(body: bytearray) -> Any:
+    """
+    Decode a body orjson rejected with the standard library parser.
+
+    FastAPI reports JSON errors using the standard library's messages, so the
+    body is decoded again to raise an identical 422 error.
+    """
+    try:
+        return json.loads(body)
+    except json.JSONDecodeError as exc:
+        errors = [
+            {
+                "type": "json_invalid",
+                "loc": ("body", exc.pos),
+                "msg": "JSON decode error",
+                "input": {},
+                "ctx": {"error": exc.msg},
+            }
+        ]
+        raise RequestValidationError(errors, body=exc.doc) from exc
+
+
+def _validate_slowly(body: Any) -> ProteinAnalysisRequest:
+    """
+    Validate a body with Pydantic, raising the same 422 error FastAPI would.
+
+    Only reached for bodies the fast path does not accept, so the exact error
+    details come from the model itself.
+    """
+    if body is None:
+        errors = [
+            {
+                "type": "missing",
+                "loc": ("body",),
+                "msg": "Field required",
+                "input": None,
+            }
+        ]
+        raise RequestValidationError(errors, body=body)
+
+    try:
+        return ProteinAnalysisRequest.model_validate(body, from_attributes=True)
+    except ValidationError as exc:
+        errors = [
+            {**error, "loc": ("body",) + error["loc"]}
+            for error in exc.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=body) from exc
+
+
+async def parse_analysis_request(request: Request) -> ProteinAnalysisRequest:
+    """
+    Dependency that parses a ProteinAnalysisRequest without per-item validation.
+
+    The body is size-limited while being read, and the sequence count is
+    checked on the raw bytes, so oversized arrays are rejected before any
+    sequence is allocated. The body is then decoded with orjson. Well-formed
+    bodies are checked in a single pass and the model is built with
+    model_construct, skipping Pydantic's per-item validation and copies.
+    Anything else falls back to Pydantic, so invalid bodies get the same 422
+    responses as the regular endpoint.
+    """
+    body_bytes = await read_body_with_limit(request, settings.MAX_REQUEST_BYTES)
+    if not body_bytes:
+        return _validate_slowly(None)
+    if not _is_json_content_type(request.headers.get("content-type")):
+        return _validate_slowly(bytes(body_bytes))
+    if _exceeds_sequence_limit(body_bytes, settings.MAX_SEQUENCES_PER_REQUEST):
+        raise _too_many_sequences()
+
+    try:
+        payload = orjson.loads(body_bytes)
+    except orjson.JSONDecodeError:
+        payload = _decode_slowly(body_bytes)
+    del body_bytes
+
+    if not isinstance(payload, dict):
+        return _validate_slowly(payload)
+
+    sequences = payload.get("sequences")
+    if (
+        isinstance(sequences, list)
+        and len(sequences) > settings.MAX_SEQUENCES_PER_REQUEST
+    ):
+        raise _too_many_sequences()
+
+    analysis_type = payload.get("analysis_type", "basic")
+    digestion = payload.get("digestion")
+    if (
+        not isinstance(sequences, list)
+        or not all(isinstance(sequence, str) for sequence in sequences)
+        or not isinstance(analysis_type, str)
+        or not (digestion is None or isinstance(digestion, dict))
+    ):
+        return _validate_slowly(payload)
+
+    try:
+        digestion_parameters = (
+            None if digestion is None else DigestionParameters.model_validate(digestion)
+        )
+    except ValidationError:
+        return _validate_slowly(payload)
+
+    return ProteinAnalysisRequest.model_construct(
+        sequences=sequences,
+        analysis_type=analysis_type,
+        digestion=digestion_parameters,
+    )
@@ -0,0 +1,101 @@
+import argparse
+import logging
+import os
+import sys
+from typing import List, Optional
+
+from functions.services.fasta_batch import (
+    ANALYSIS_TYPES,
+    OUTPUT_FORMATS,
+    FastaBatchRunner,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the offline analysis command."""
+    parser = argparse.ArgumentParser(
+        prog="batchprot",
+        description=(
+            "Analyze a FASTA file offline and write chunked CSV or Parquet output."
+        ),
+    )
+    parser.add_argument("input", help="Path to the FASTA file to analyze")
+    parser.add_argument(
+        "output_dir", help="Directory receiving part files and the checkpoint"
+    )
+    parser.add_argument(
+        "--analysis-type",
+        default="basic",
+        choices=ANALYSIS_TYPES,
+        help="Type of analysis to perform (default: basic)",
+    )
+    parser.add_argument(
+        "--format",
+        dest="output_format",
+        default="csv",
+        choices=OUTPUT_FORMATS,
+        help="Output file format; parquet requires pyarrow (default: csv)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=10_000,
+        help="Number of sequences per part file (default: 10000)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from the checkpoint in output_dir",
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="Suppress progress reporting"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the offline analysis command."""
+    args = build_parser().parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format="%(asctime)s %(message)s",
+        stream=sys.stderr,
+    )
+
+    if args.output_format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("Parquet output requires pyarrow to be installed", file=sys.stderr)
+            return 2
+
+    try:
+        runner = FastaBatchRunner(
+            args.input,
+            args.output_dir,
+            analysis_type=args.analysis_type,
+            output_format=args.output_format,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+        )
+        summary = runner.run(resume=args.resume)
+    except (ValueError, OSError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+
+    print(
+        f"Analyzed {summary['analyzed']} sequences "
+        f"({summary['failed']} failed) in {summary['chunks']} chunks"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+import logging
+import zlib
+from typing import Dict, List, Optional
+
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Server preference when the client accepts several codings with equal weight
+SUPPORTED_ENCODINGS = ("zstd", "gzip")
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Choose a response coding from an Accept-Encoding header.
+
+    The coding with the highest quality value wins, ties going to the server
+    preference. Codings with q=0 are refused, and '*' covers unlisted codings.
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        param = params.strip().lower()
+        if param.startswith("q="):
+            try:
+                weight = float(param[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding] = weight
+
+    best: Optional[str] = None
+    best_weight = 0.0
+    for coding in SUPPORTED_ENCODINGS:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def configure_compression_logging(level: str) -> None:
+    """
+    Set the level of the compression logger.
+
+    A stream handler is attached when no handler is configured anywhere, since
+    Python's last-resort handler drops records below WARNING.
+    """
+    logger.setLevel(level)
+    if not logger.hasHandlers():
+        logger.addHandler(logging.StreamHandler())
+
+
+class _Compressor:
+    """Incremental compressor that can flush after each streamed chunk."""
+
+    def __init__(self, encoding: str, gzip_level: int, zstd_level: int):
+        if encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=zstd_level).compressobj()
+            self._sync_flush = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        else:
+            self._compressor = zlib.compressobj(
+                gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS  # gzip container
+            )
+            self._sync_flush = zlib.Z_SYNC_FLUSH
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        chunk = self._compressor.compress(data)
+        if final:
+            return chunk + self._compressor.flush()
+        return chunk + self._compressor.flush(self._sync_flush)
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses under a path prefix with zstd or gzip.
+
+    The coding is negotiated from Accept-Encoding. Bodies smaller than
+    minimum_size are sent as-is. Streamed bodies are buffered until they reach
+    minimum_size, then compressed chunk by chunk and flushed so clients still
+    receive each chunk as it is produced. Compressed and uncompressed byte
+    counts are logged for every compressed response.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefix: str,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        zstd_level: int = 3,
+    ):
+        self.app = app
+        self.path_prefix = path_prefix
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+        if not path.startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, path, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Per-response state for CompressionMiddleware."""
+
+    def __init__(
+        self, middleware: CompressionMiddleware, encoding: str, path: str, send: Send
+    ):
+        self._middleware = middleware
+        self._encoding = encoding
+        self._path = path
+        self._send = send
+
+        self._start_message: Optional[Message] = None
+        self._buffer: List[bytes] = []
+        self._buffered_size = 0
+        self._compressor: Optional[_Compressor] = None
+        self._passthrough = False
+        self._uncompressed_size = 0
+        self._compressed_size = 0
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start_message = message
+            headers = Headers(raw=message["headers"])
+            # Leave responses that are already encoded untouched
+            self._passthrough = "content-encoding" in headers
+            return
+
+        if message["type"] != "http.response.body" or self._passthrough:
+            if self._start_message is not None:
+                await self._send(self._start_message)
+                self._start_message = None
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._compressor is None:
+            self._buffer.append(body)
+            self._buffered_size += len(body)
+            if self._buffered_size < self._middleware.minimum_size:
+                if not more_body:
+                    await self._send_start(encoded=False)
+                    await self._send(
+                        {"type": "http.response.body", "body": b"".join(self._buffer)}
+                    )
+                return
+            body = b"".join(self._buffer)
+            self._buffer = []
+            self._compressor = _Compressor(
+                self._encoding,
+                self._middleware.gzip_level,
+                self._middleware.zstd_level,
+            )
+
+        self._uncompressed_size += len(body)
+        chunk = self._compressor.compress(body, final=not more_body)
+        self._compressed_size += len(chunk)
+
+        if self._start_message is not None:
+            # The compressed length is only known up front for single-chunk bodies
+            await self._send_start(
+                encoded=True, content_length=None if more_body else len(chunk)
+            )
+        await self._send(
+            {"type": "http.response.body", "body": chunk, "more_body": more_body}
+        )
+
+        if not more_body:
+            logger.info(
+                "Compressed %s response for %s: %d -> %d bytes",
+                self._encoding,
+                self._path,
+                self._uncompressed_size,
+                self._compressed_size,
+            )
+
+    async def _send_start(
+        self, encoded: bool, content_length: Optional[int] = None
+    ) -> None:
+        """Send the held response start, rewriting headers for compression."""
+        headers = MutableHeaders(raw=self._start_message["headers"])
+        headers.add_vary_header("Accept-Encoding")
+        if encoded:
+            headers["Content-Encoding"] = self._encoding
+            if content_length is None:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(content_length)
+
+        await self._send(self._start_message)
+        self._start_message = None
@@ -1,7 +1,7 @@
 import secrets
 from typing import List, Literal
 
-from pydantic import AnyHttpUrl, TypeAdapter, computed_field
+from pydantic import AnyHttpUrl, Field, TypeAdapter, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -22,6 +22,16 @@ class Settings(BaseSettings):
 
     ENVIRONMENT: Literal["dev", "production"] = "dev"
 
+    # Limits enforced by the fast ingestion path before analysis starts
+    MAX_REQUEST_BYTES: int = 64 * 1024 * 1024
+    MAX_SEQUENCES_PER_REQUEST: int = 200_000
+
+    # Response compression for the protein analysis endpoints
+    COMPRESSION_MINIMUM_SIZE: int = Field(default=1024, ge=0)
+    GZIP_COMPRESSION_LEVEL: int = Field(default=6, ge=0, le=9)
+    ZSTD_COMPRESSION_LEVEL: int = Field(default=3, le=22)  # Negative is faster
+    COMPRESSION_LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
+
     AUTH_BASE_URL: AnyHttpUrl = "http://localhost:3000"
 
     @computed_field
@@ -6,6 +6,10 @@ from fastapi.routing import APIRoute
 from mangum import Mangum
 
 from functions.api.api_v1.api import api_router as api_v1_router
+from functions.core.compression import (
+    CompressionMiddleware,
+    configure_compression_logging,
+)
 from functions.core.config import settings
 
 
@@ -37,12 +41,22 @@ app = FastAPI(
 )
 
 # Configure logging
+configure_compression_logging(settings.COMPRESSION_LOG_LEVEL)
 if settings.ENVIRONMENT == "dev":
     logger = logging.getLogger("uvicorn")
     logger.warning(
         "Running in development mode - CORS is configured to allow all origins."
     )
 
+# Compress protein analysis responses, including streamed ones
+app.add_middleware(
+    CompressionMiddleware,
+    path_prefix=f"{settings.API_V1_STR}/analyze",
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.GZIP_COMPRESSION_LEVEL,
+    zstd_level=settings.ZSTD_COMPRESSION_LEVEL,
+)
+
 # Set all CORS enabled origins
 if settings.PARSED_CORS_ORIGINS:
     app.add_middleware(
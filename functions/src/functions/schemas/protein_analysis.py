@@ -1,11 +1,31 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+
+class DigestionParameters(BaseModel):
+    enzyme: Literal["trypsin", "lys-c", "glu-c"] = "trypsin"
+    missed_cleavages: int = Field(default=0, ge=0, le=3)
+
+    # Filters keep the peptide list bounded; masses are monoisotopic
+    min_length: int = Field(default=6, ge=1)
+    max_length: int = Field(default=50, ge=1)
+    min_mass: Optional[float] = None
+    max_mass: Optional[float] = None
 
 
 class ProteinAnalysisRequest(BaseModel):
     sequences: List[str]
     analysis_type: str = "basic"  # Default to basic analysis
+    digestion: Optional[DigestionParameters] = None  # Used by digest analysis
+
+
+class Peptide(BaseModel):
+    start: int  # 1-based, inclusive
+    end: int  # 1-based, inclusive
+    missed_cleavages: int
+    monoisotopic_mass: float
+    average_mass: float
 
 
 class ProteinAnalysisResult(BaseModel):
@@ -29,5 +49,74 @@ class ProteinAnalysisResult(BaseModel):
     amino_acid_percentages: Dict[str, float]
 
 
+class DigestionAnalysisResult(ProteinAnalysisResult):
+    peptides: List[Peptide]
+
+
+# Responses keep the digest subclass so its peptides are serialized
+AnalysisResult = Union[DigestionAnalysisResult, ProteinAnalysisResult]
+
+
 class ProteinAnalysisResponse(BaseModel):
-    results: List[ProteinAnalysisResult]
+    results: List[AnalysisResult]
+
+
+class VariantScanRequest(BaseModel):
+    parent_sequence: str
+    variants: List[str]  # e.g. "A123G" or "A123G/K45R" for multiple mutations
+
+
+class VariantAnalysisResult(BaseModel):
+    variant: str
+    length: int
+    molecular_weight: float
+    isoelectric_point: float
+    aromaticity: float
+    instability_index: float
+    gravy: float
+    helix_fraction: float
+    turn_fraction: float
+    sheet_fraction: float
+    extinction_coeff_reduced: int
+    extinction_coeff_oxidized: int
+    charge_at_ph7: float
+
+    amino_acid_counts: Dict[str, int]
+    amino_acid_percentages: Dict[str, float]
+
+
+class VariantScanResponse(BaseModel):
+    parent: ProteinAnalysisResult
+    variants: List[VariantAnalysisResult]
+
+
+class ClusteringParameters(BaseModel):
+    identity_threshold: float = Field(default=0.9, ge=0.4, le=1.0)
+    kmer_size: int = Field(default=3, ge=1, le=6)
+
+    # LSH banding: more bands catch more distant pairs, more rows fewer
+    bands: int = Field(default=32, ge=1, le=128)
+    rows_per_band: int = Field(default=4, ge=1, le=16)
+
+
+class ClusteringRequest(BaseModel):
+    sequences: List[str]
+    clustering: ClusteringParameters = Field(default_factory=ClusteringParameters)
+
+    # When set, representatives are analyzed with this analysis type
+    analysis_type: Optional[str] = None
+    digestion: Optional[DigestionParameters] = None
+
+
+class SequenceCluster(BaseModel):
+    cluster_id: int
+    representative: int  # Index into the request sequences
+    members: List[int]  # Indices into the request sequences, ascending
+
+
+class ClusteringResponse(BaseModel):
+    clusters: List[SequenceCluster]
+    assignments: List[int]  # Cluster id of each request sequence
+
+    # One result per cluster, in cluster order, when analysis was requested
+    representative_results: Optional[List[AnalysisResult]] = None
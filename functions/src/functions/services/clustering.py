@@ -0,0 +1,359 @@
+import bisect
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from Bio.Align import PairwiseAligner
+
+from functions.schemas.protein_analysis import (
+    ClusteringParameters,
+    ClusteringResponse,
+    SequenceCluster,
+)
+
+# Universal hashing modulo a Mersenne prime; k-mer codes stay below it for
+# k <= 6, so (a * code + b) fits in 64 bits without overflow
+_PRIME = np.uint64((1 << 31) - 1)
+_BITS_PER_RESIDUE = np.uint64(5)
+_SEED = 42
+
+# Largest hash matrix built at once while sketching, in elements (8 MB)
+_SKETCH_BLOCK_ELEMENTS = 1 << 20
+
+# Gap scores, shared by the aligners and _segment_score
+_OPEN_GAP_SCORE = -4
+_EXTEND_GAP_SCORE = -1
+
+# Shared words chained to bound identity, and the largest stretch between
+# them that is aligned rather than scored as mismatches
+_ANCHOR_WORD_SIZE = 8
+_SEGMENT_ALIGNMENT_CELLS = 1 << 20
+
+# Largest pair aligned in full, in dynamic programming cells (about a second)
+_MAX_ALIGNMENT_CELLS = 1 << 25
+
+# Word sizes tried by the shared k-mer filter, most selective first
+_FILTER_WORD_SIZES = (5, 4, 3, 2)
+
+
+class SequenceClusterer:
+    """
+    Greedy near-duplicate clustering of protein sequences, CD-HIT style.
+
+    Sequences are processed longest first; each either joins the first
+    existing representative it matches at the identity threshold or becomes
+    a new representative. Rather than comparing against every representative,
+    each sequence gets a MinHash sketch of its k-mers, and only representatives
+    sharing a locality-sensitive hashing band bucket are aligned.
+
+    Identity is the number of identical aligned residues divided by the length
+    of the shorter sequence. Before aligning a candidate pair, an alignment
+    chained through shared unique words accepts pairs it already proves
+    similar enough, such as point variants, fragments and isoforms, and a
+    shared k-mer count rejects pairs that cannot reach the threshold (CD-HIT's
+    short word filter). Pairs too long to align in full are merged only when
+    the chained alignment proves them similar.
+    """
+
+    def __init__(self, parameters: Optional[ClusteringParameters] = None):
+        """
+        Initialize the clusterer.
+
+        Args:
+            parameters: Identity threshold, k-mer size and LSH banding
+        """
+        self._parameters = parameters or ClusteringParameters()
+        num_hashes = self._parameters.bands * self._parameters.rows_per_band
+
+        # Fixed seed keeps sketches comparable across instances and runs
+        rng = np.random.default_rng(_SEED)
+        self._hash_a = rng.integers(1, _PRIME, size=(num_hashes, 1), dtype=np.uint64)
+        self._hash_b = rng.integers(0, _PRIME, size=(num_hashes, 1), dtype=np.uint64)
+
+        # Gaps are penalised so unrelated residues are not stitched together
+        # into matches; end gaps are free so fragments align to their parent
+        self._aligner = self._make_aligner(free_start=True, free_end=True)
+
+        # Stretches between anchors keep the gap penalty on anchored sides
+        self._leading_aligner = self._make_aligner(free_start=True, free_end=False)
+        self._internal_aligner = self._make_aligner(free_start=False, free_end=False)
+        self._trailing_aligner = self._make_aligner(free_start=False, free_end=True)
+
+    @staticmethod
+    def _make_aligner(free_start: bool, free_end: bool) -> PairwiseAligner:
+        aligner = PairwiseAligner(
+            mode="global",
+            match_score=1,
+            mismatch_score=0,
+            open_gap_score=_OPEN_GAP_SCORE,
+            extend_gap_score=_EXTEND_GAP_SCORE,
+        )
+        if free_start:
+            aligner.left_open_gap_score = aligner.left_extend_gap_score = 0
+        if free_end:
+            aligner.right_open_gap_score = aligner.right_extend_gap_score = 0
+        return aligner
+
+    @staticmethod
+    def _kmer_codes(sequence: str, kmer_size: int) -> np.ndarray:
+        """Encode every k-mer of a sequence as an integer, in sequence order."""
+        residues = np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+        residues = residues.astype(np.uint64) - np.uint64(ord("A") - 1)
+
+        # Sequences shorter than k are encoded as a single whole-sequence k-mer
+        k = min(kmer_size, len(residues))
+        count = len(residues) - k + 1
+        codes = np.zeros(count, dtype=np.uint64)
+        for offset in range(k):
+            codes = (codes << _BITS_PER_RESIDUE) | residues[offset : offset + count]
+        return codes
+
+    def sketch(self, sequence: str) -> np.ndarray:
+        """Compute the MinHash signature of a sequence."""
+        codes = np.unique(self._kmer_codes(sequence, self._parameters.kmer_size))
+
+        # Hash blocks of k-mers so memory stays bounded for long sequences
+        num_hashes = len(self._hash_a)
+        block_size = max(1, _SKETCH_BLOCK_ELEMENTS // num_hashes)
+        signature = np.full(num_hashes, _PRIME, dtype=np.uint64)
+        for start in range(0, len(codes), block_size):
+            hashes = self._hash_a * codes[start : start + block_size]
+            hashes += self._hash_b
+            hashes %= _PRIME
+            np.minimum(signature, hashes.min(axis=1), out=signature)
+        return signature
+
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        rows = self._parameters.rows_per_band
+        return [
+            (band, signature[band * rows : (band + 1) * rows].tobytes())
+            for band in range(self._parameters.bands)
+        ]
+
+    def identity(self, first: str, second: str) -> float:
+        """Compute the identity of two sequences relative to the shorter one."""
+        if first == second:
+            return 1.0
+        alignment = self._aligner.align(first, second)[0]
+        return alignment.counts().identities / min(len(first), len(second))
+
+    def _shared_kmers(self, first: str, second: str, kmer_size: int) -> int:
+        """Count the k-mer occurrences two sequences have in common."""
+        first_codes, first_counts = np.unique(
+            self._kmer_codes(first, kmer_size), return_counts=True
+        )
+        second_codes, second_counts = np.unique(
+            self._kmer_codes(second, kmer_size), return_counts=True
+        )
+        _, first_index, second_index = np.intersect1d(
+            first_codes, second_codes, assume_unique=True, return_indices=True
+        )
+        return int(
+            np.minimum(first_counts[first_index], second_counts[second_index]).sum()
+        )
+
+    def _segment_score(self, first: str, second: str, aligner: PairwiseAligner) -> int:
+        """
+        Score an alignment of two stretches lying between chained anchors.
+
+        Stretches too large to align cheaply are scored as mismatches plus
+        one gap for the length difference, which is still a valid alignment.
+        """
+        if not first or not second:
+            # A lone gap is free where it falls on a sequence end
+            if aligner is not self._internal_aligner:
+                return 0
+        elif len(first) * len(second) <= _SEGMENT_ALIGNMENT_CELLS:
+            return int(aligner.score(first, second))
+
+        gap_length = abs(len(first) - len(second))
+        if not gap_length:
+            return 0
+        return _OPEN_GAP_SCORE + (gap_length - 1) * _EXTEND_GAP_SCORE
+
+    def _anchored_score(self, first: str, second: str) -> int:
+        """
+        Score an alignment of two sequences chained through shared words.
+
+        Words occurring exactly once in each sequence are chained in order
+        along the longest increasing run of positions, and only the stretches
+        between them are aligned. This is the score of one valid alignment,
+        so it is at most the optimal score, and the optimal alignment has at
+        least as many identities as its score.
+        """
+        anchors = self._unique_shared_words(first, second)
+
+        # Keep anchors consistent with a single alignment: overlapping words
+        # must lie on the same diagonal as the run they extend
+        runs: List[List[int]] = []  # [first start, second start, length]
+        for first_start, second_start in anchors:
+            if runs:
+                run_first, run_second, run_length = runs[-1]
+                if (
+                    first_start - run_first == second_start - run_second
+                    and first_start <= run_first + run_length
+                ):
+                    runs[-1][2] = first_start - run_first + _ANCHOR_WORD_SIZE
+                    continue
+                if (
+                    first_start < run_first + run_length
+                    or second_start < run_second + run_length
+                ):
+                    continue
+            runs.append([first_start, second_start, _ANCHOR_WORD_SIZE])
+
+        if not runs:
+            return self._segment_score(first, second, self._aligner)
+
+        score = 0
+        first_end = second_end = 0
+        for index, (first_start, second_start, length) in enumerate(runs):
+            aligner = self._leading_aligner if index == 0 else self._internal_aligner
+            score += self._segment_score(
+                first[first_end:first_start], second[second_end:second_start], aligner
+            )
+            score += length
+            first_end, second_end = first_start + length, second_start + length
+        score += self._segment_score(
+            first[first_end:], second[second_end:], self._trailing_aligner
+        )
+        return score
+
+    def _unique_shared_words(self, first: str, second: str) -> List[Tuple[int, int]]:
+        """
+        Find the longest chain of words occurring once in each sequence whose
+        positions increase in both.
+        """
+        positions = []
+        for sequence in (first, second):
+            if len(sequence) < _ANCHOR_WORD_SIZE:
+                return []
+            codes, starts, counts = np.unique(
+                self._kmer_codes(sequence, _ANCHOR_WORD_SIZE),
+                return_index=True,
+                return_counts=True,
+            )
+            positions.append((codes[counts == 1], starts[counts == 1]))
+        (first_codes, first_starts), (second_codes, second_starts) = positions
+        _, first_index, second_index = np.intersect1d(
+            first_codes, second_codes, assume_unique=True, return_indices=True
+        )
+        order = np.argsort(first_starts[first_index])
+        first_starts = first_starts[first_index][order].tolist()
+        second_starts = second_starts[second_index][order].tolist()
+
+        # Longest increasing subsequence of second-sequence positions
+        tails: List[int] = []  # Smallest chain end for each chain length
+        tail_indices: List[int] = []
+        previous = [-1] * len(second_starts)
+        for index, start in enumerate(second_starts):
+            length = bisect.bisect_left(tails, start)
+            if length:
+                previous[index] = tail_indices[length - 1]
+            if length == len(tails):
+                tails.append(start)
+                tail_indices.append(index)
+            else:
+                tails[length] = start
+                tail_indices[length] = index
+
+        chain = []
+        index = tail_indices[-1] if tail_indices else -1
+        while index >= 0:
+            chain.append((first_starts[index], second_starts[index]))
+            index = previous[index]
+        return chain[::-1]
+
+    def matches(self, first: str, second: str) -> bool:
+        """
+        Check whether two sequences reach the identity threshold.
+
+        Cheap bounds decide most pairs; only the rest are aligned, unless
+        they are too long to align in reasonable time.
+        """
+        if first == second:
+            return True
+        threshold = self._parameters.identity_threshold
+        shorter = min(len(first), len(second))
+        needed = threshold * shorter
+
+        lower_bound = self._anchored_score(first, second)
+        if lower_bound >= needed:
+            return True
+
+        # The optimal alignment scores at least the lower bound, which limits
+        # how many internal gaps it can open
+        max_gaps = (shorter - lower_bound) // -_OPEN_GAP_SCORE
+        for k in _FILTER_WORD_SIZES:
+            # Each residue of the shorter sequence that is not identically
+            # aligned breaks at most k of its k-mers, and each gap k - 1
+            min_shared = shorter - k + 1 - (shorter - needed) * k - max_gaps * (k - 1)
+            if shorter >= k and min_shared > 0:
+                if self._shared_kmers(first, second, k) < min_shared:
+                    return False
+                break
+
+        # Pairs too long to align within a request are only merged when the
+        # bounds above prove them similar enough
+        if len(first) * len(second) > _MAX_ALIGNMENT_CELLS:
+            return False
+        return self.identity(first, second) >= threshold
+
+    def cluster(self, sequences: List[str]) -> ClusteringResponse:
+        """
+        Cluster sequences at the configured identity threshold.
+
+        Args:
+            sequences: Validated, uppercase protein sequences
+
+        Returns:
+            Clusters in creation order and the cluster id of each sequence
+        """
+        signatures = [self.sketch(sequence) for sequence in sequences]
+        order = sorted(range(len(sequences)), key=lambda i: -len(sequences[i]))
+
+        buckets: Dict[Tuple[int, bytes], List[int]] = {}
+        representatives: List[int] = []
+        assignments = [-1] * len(sequences)
+
+        for index in order:
+            keys = self._band_keys(signatures[index])
+            candidates = {
+                cluster_id for key in keys for cluster_id in buckets.get(key, ())
+            }
+
+            # Try the representatives with the most similar sketches first
+            signature = signatures[index]
+            shared_hashes = {
+                cluster_id: np.count_nonzero(
+                    signature == signatures[representatives[cluster_id]]
+                )
+                for cluster_id in candidates
+            }
+            ranked = sorted(candidates, key=lambda c: (-shared_hashes[c], c))
+            for cluster_id in ranked:
+                representative = representatives[cluster_id]
+                if self.matches(sequences[index], sequences[representative]):
+                    assignments[index] = cluster_id
+                    break
+            else:
+                cluster_id = len(representatives)
+                representatives.append(index)
+                assignments[index] = cluster_id
+                for key in keys:
+                    buckets.setdefault(key, []).append(cluster_id)
+
+        members: List[List[int]] = [[] for _ in representatives]
+        for index, cluster_id in enumerate(assignments):
+            members[cluster_id].append(index)
+
+        return ClusteringResponse(
+            clusters=[
+                SequenceCluster(
+                    cluster_id=cluster_id,
+                    representative=representative,
+                    members=members[cluster_id],
+                )
+                for cluster_id, representative in enumerate(representatives)
+            ],
+            assignments=assignments,
+        )
@@ -0,0 +1,102 @@
+import re
+from itertools import accumulate
+from typing import Dict, List
+
+from Bio.Data import IUPACData
+
+from functions.schemas.protein_analysis import DigestionParameters, Peptide
+
+# Water masses match Bio.SeqUtils.molecular_weight
+MONOISOTOPIC_WATER = 18.010565
+AVERAGE_WATER = 18.0153
+
+# Residue (dehydrated) masses, so a peptide mass is a residue sum plus one water
+_MONOISOTOPIC_RESIDUE_MASSES: Dict[str, float] = {
+    aa: weight - MONOISOTOPIC_WATER
+    for aa, weight in IUPACData.monoisotopic_protein_weights.items()
+}
+_AVERAGE_RESIDUE_MASSES: Dict[str, float] = {
+    aa: weight - AVERAGE_WATER for aa, weight in IUPACData.protein_weights.items()
+}
+
+# Cleavage rules: the enzyme cuts after the matched residue
+_CLEAVAGE_PATTERNS: Dict[str, re.Pattern] = {
+    "trypsin": re.compile(r"[KR](?!P)"),
+    "lys-c": re.compile(r"K"),
+    "glu-c": re.compile(r"E"),
+}
+
+
+def get_supported_enzymes() -> List[str]:
+    """Get list of supported enzymes."""
+    return list(_CLEAVAGE_PATTERNS)
+
+
+def find_cleavage_sites(sequence: str, enzyme: str) -> List[int]:
+    """
+    Scan a sequence once for cleavage sites.
+
+    Returns:
+        Sorted peptide boundaries, including 0 and len(sequence)
+    """
+    sites = [match.end() for match in _CLEAVAGE_PATTERNS[enzyme].finditer(sequence)]
+    if not sites or sites[-1] != len(sequence):
+        sites.append(len(sequence))
+    return [0] + sites
+
+
+def _prefix_masses(sequence: str, residue_masses: Dict[str, float]) -> List[float]:
+    """Cumulative residue masses, so any peptide mass is a single subtraction."""
+    return list(accumulate((residue_masses[aa] for aa in sequence), initial=0.0))
+
+
+def digest_sequence(sequence: str, parameters: DigestionParameters) -> List[Peptide]:
+    """
+    Digest a sequence in silico and return the peptides passing the filters.
+
+    Peptides spanning up to `missed_cleavages` internal sites are included.
+    Extending a peptide only makes it longer and heavier, so enumeration from
+    each start stops as soon as the length or mass upper bound is exceeded.
+
+    Args:
+        sequence: The protein sequence to digest
+        parameters: Enzyme, missed cleavages and peptide filters
+
+    Returns:
+        Peptides ordered by start position, then by missed cleavages
+    """
+    boundaries = find_cleavage_sites(sequence, parameters.enzyme)
+    monoisotopic = _prefix_masses(sequence, _MONOISOTOPIC_RESIDUE_MASSES)
+    average = _prefix_masses(sequence, _AVERAGE_RESIDUE_MASSES)
+
+    peptides: List[Peptide] = []
+    last = len(boundaries) - 1
+    for i in range(last):
+        start = boundaries[i]
+        for missed in range(parameters.missed_cleavages + 1):
+            if i + missed + 1 > last:
+                break
+            end = boundaries[i + missed + 1]
+
+            length = end - start
+            if length > parameters.max_length:
+                break
+            mass = monoisotopic[end] - monoisotopic[start] + MONOISOTOPIC_WATER
+            if parameters.max_mass is not None and mass > parameters.max_mass:
+                break
+            if length < parameters.min_length:
+                continue
+            if parameters.min_mass is not None and mass < parameters.min_mass:
+                continue
+
+            peptides.append(
+                Peptide(
+                    start=start + 1,
+                    end=end,
+                    missed_cleavages=missed,
+                    monoisotopic_mass=mass,
+                    average_mass=average[end] - average[start] + AVERAGE_WATER,
+                )
+            )
+
+    return peptides
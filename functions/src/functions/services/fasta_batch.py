@@ -0,0 +1,302 @@
+import csv
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from Bio import SeqIO
+
+from functions.services.protein_analyzers import ProteinAnalysisFactory
+
+logger = logging.getLogger(__name__)
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+# Scalar ProteinAnalysisResult fields written as output columns, with Parquet types.
+# The echoed sequence is left out to keep whole-proteome output compact.
+RESULT_COLUMNS: Dict[str, str] = {
+    "length": "int64",
+    "molecular_weight": "float64",
+    "isoelectric_point": "float64",
+    "aromaticity": "float64",
+    "instability_index": "float64",
+    "gravy": "float64",
+    "helix_fraction": "float64",
+    "turn_fraction": "float64",
+    "sheet_fraction": "float64",
+    "extinction_coeff_reduced": "int64",
+    "extinction_coeff_oxidized": "int64",
+    "charge_at_ph7": "float64",
+}
+
+# Digestion is left out: its peptide lists do not fit the flat row layout
+ANALYSIS_TYPES = ("basic", "advanced")
+OUTPUT_FORMATS = ("csv", "parquet")
+CHECKPOINT_FILENAME = "_checkpoint.json"
+
+# A chunk handed to a worker: (chunk index, [(record id, sequence), ...])
+Chunk = Tuple[int, List[Tuple[str, str]]]
+
+
+def output_columns() -> List[str]:
+    """Get the ordered list of columns written for each sequence."""
+    return (
+        ["id"]
+        + list(RESULT_COLUMNS)
+        + [f"count_{aa}" for aa in AMINO_ACIDS]
+        + [f"percent_{aa}" for aa in AMINO_ACIDS]
+        + ["error"]
+    )
+
+
+def _analyze_record(record_id: str, sequence: str, analysis_type: str) -> Dict:
+    """Analyze a single record and flatten the result into an output row."""
+    row: Dict = dict.fromkeys(output_columns())
+    row["id"] = record_id
+
+    try:
+        analyzer = ProteinAnalysisFactory.create_analyzer(analysis_type, sequence)
+        result = analyzer.analyze()
+    except ValueError as exc:
+        row["error"] = str(exc)
+        return row
+
+    for column in RESULT_COLUMNS:
+        row[column] = getattr(result, column)
+    for aa in AMINO_ACIDS:
+        row[f"count_{aa}"] = result.amino_acid_counts.get(aa, 0)
+        row[f"percent_{aa}"] = result.amino_acid_percentages.get(aa, 0.0)
+    return row
+
+
+def _write_csv(rows: List[Dict], path: Path) -> None:
+    with open(path, "w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=output_columns())
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _write_parquet(rows: List[Dict], path: Path) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    column_types = {"id": "string", **RESULT_COLUMNS, "error": "string"}
+    column_types.update({f"count_{aa}": "int64" for aa in AMINO_ACIDS})
+    column_types.update({f"percent_{aa}": "float64" for aa in AMINO_ACIDS})
+    schema = pa.schema(
+        [(name, pa.type_for_alias(column_types[name])) for name in output_columns()]
+    )
+    pq.write_table(pa.Table.from_pylist(rows, schema=schema), path)
+
+
+def process_chunk(
+    chunk: Chunk, output_dir: str, analysis_type: str, output_format: str
+) -> Tuple[int, int, int]:
+    """
+    Analyze one chunk of records and write it to its own part file.
+
+    Runs inside worker processes, so the rows never travel back to the parent.
+    The part file is written under a temporary name and renamed once complete,
+    which keeps partially written chunks out of the output on interruption.
+
+    Returns:
+        Tuple of (chunk index, analyzed count, failed count)
+    """
+    index, records = chunk
+    rows = [_analyze_record(rid, seq, analysis_type) for rid, seq in records]
+    failed = sum(1 for row in rows if row["error"] is not None)
+
+    final_path = Path(output_dir) / f"part-{index:06d}.{output_format}"
+    tmp_path = final_path.with_name(final_path.name + ".tmp")
+    if output_format == "parquet":
+        _write_parquet(rows, tmp_path)
+    else:
+        _write_csv(rows, tmp_path)
+    os.replace(tmp_path, final_path)
+
+    return index, len(rows) - failed, failed
+
+
+class FastaBatchRunner:
+    """
+    Streams a FASTA file through the protein analyzers in chunks.
+
+    Chunks are sharded across worker processes and written as separate part
+    files. Only a bounded number of chunks are in flight at once, so memory
+    stays flat regardless of input size. Completed chunk indices are recorded
+    in a checkpoint file, allowing an interrupted run to resume.
+    """
+
+    def __init__(
+        self,
+        input_path: str,
+        output_dir: str,
+        analysis_type: str = "basic",
+        output_format: str = "csv",
+        chunk_size: int = 10_000,
+        workers: int = 1,
+        max_pending: Optional[int] = None,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            input_path: Path to the FASTA file to analyze
+            output_dir: Directory receiving part files and the checkpoint
+            analysis_type: Type of analysis to perform
+            output_format: Output file format ('csv' or 'parquet')
+            chunk_size: Number of sequences per part file
+            workers: Number of worker processes (1 runs in-process)
+            max_pending: Maximum chunks in flight (defaults to 2 per worker)
+
+        Raises:
+            ValueError: If any option is not supported
+        """
+        if analysis_type.lower() not in ANALYSIS_TYPES:
+            raise ValueError(f"Unsupported analysis type: {analysis_type}")
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        if workers < 1:
+            raise ValueError("Workers must be at least 1")
+
+        self._input_path = Path(input_path)
+        self._output_dir = Path(output_dir)
+        self._analysis_type = analysis_type.lower()
+        self._output_format = output_format
+        self._chunk_size = chunk_size
+        self._workers = workers
+        self._max_pending = max_pending or workers * 2
+
+        self._completed: Set[int] = set()
+        self._analyzed = 0
+        self._failed = 0
+        self._started = 0.0
+        self._resumed_from = 0
+
+    @property
+    def checkpoint_path(self) -> Path:
+        """Get the path of the checkpoint file."""
+        return self._output_dir / CHECKPOINT_FILENAME
+
+    def _run_parameters(self) -> Dict:
+        """Parameters that must match for a checkpoint to be resumed."""
+        return {
+            "input": str(self._input_path.resolve()),
+            "analysis_type": self._analysis_type,
+            "output_format": self._output_format,
+            "chunk_size": self._chunk_size,
+        }
+
+    def _load_checkpoint(self, resume: bool) -> None:
+        """
+        Load completed chunks from an existing checkpoint.
+
+        Raises:
+            ValueError: If a checkpoint exists but cannot be resumed
+        """
+        if not self.checkpoint_path.exists():
+            return
+        if not resume:
+            raise ValueError(
+                f"{self._output_dir} already contains a checkpoint; "
+                "resume the run or choose another output directory"
+            )
+
+        checkpoint = json.loads(self.checkpoint_path.read_text())
+        if checkpoint.get("parameters") != self._run_parameters():
+            raise ValueError(
+                "Checkpoint was written with different parameters: "
+                f"{checkpoint.get('parameters')}"
+            )
+        self._completed = set(checkpoint["completed"])
+        self._analyzed = checkpoint["analyzed"]
+        self._failed = checkpoint["failed"]
+
+    def _save_checkpoint(self) -> None:
+        """Atomically write the checkpoint file."""
+        checkpoint = {
+            "parameters": self._run_parameters(),
+            "completed": sorted(self._completed),
+            "analyzed": self._analyzed,
+            "failed": self._failed,
+        }
+        tmp_path = self.checkpoint_path.with_name(CHECKPOINT_FILENAME + ".tmp")
+        tmp_path.write_text(json.dumps(checkpoint))
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _iter_chunks(self) -> Iterator[Chunk]:
+        """Stream the FASTA file in chunks, skipping chunks already completed."""
+        records: Iterable = SeqIO.parse(str(self._input_path), "fasta")
+        pairs = ((record.id, str(record.seq)) for record in records)
+        index = 0
+        while True:
+            batch = list(islice(pairs, self._chunk_size))
+            if not batch:
+                return
+            if index not in self._completed:
+                yield index, batch
+            index += 1
+
+    def _record_chunk(self, index: int, analyzed: int, failed: int) -> None:
+        self._completed.add(index)
+        self._analyzed += analyzed
+        self._failed += failed
+        self._save_checkpoint()
+
+        elapsed = time.monotonic() - self._started
+        processed = self._analyzed + self._failed - self._resumed_from
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            "Chunk %d done: %d chunks, %d sequences (%d failed), %.0f seq/s",
+            index,
+            len(self._completed),
+            self._analyzed + self._failed,
+            self._failed,
+            rate,
+        )
+
+    def run(self, resume: bool = False) -> Dict[str, int]:
+        """
+        Run the analysis over the whole file.
+
+        Args:
+            resume: Continue from an existing checkpoint in the output directory
+
+        Returns:
+            Summary with chunk, analyzed and failed counts
+        """
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        self._load_checkpoint(resume)
+        if self._completed:
+            logger.info("Resuming with %d chunks already done", len(self._completed))
+
+        self._started = time.monotonic()
+        self._resumed_from = self._analyzed + self._failed
+        task_args = (str(self._output_dir), self._analysis_type, self._output_format)
+
+        if self._workers == 1:
+            for chunk in self._iter_chunks():
+                self._record_chunk(*process_chunk(chunk, *task_args))
+        else:
+            with ProcessPoolExecutor(max_workers=self._workers) as executor:
+                pending: Set[Future] = set()
+                for chunk in self._iter_chunks():
+                    if len(pending) >= self._max_pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            self._record_chunk(*future.result())
+                    pending.add(executor.submit(process_chunk, chunk, *task_args))
+                for future in wait(pending).done:
+                    self._record_chunk(*future.result())
+
+        return {
+            "chunks": len(self._completed),
+            "analyzed": self._analyzed,
+            "failed": self._failed,
+        }
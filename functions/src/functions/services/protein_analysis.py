@@ -1,26 +1,99 @@
-from typing import List
+from typing import Iterator, List, Optional
 
-from functions.schemas.protein_analysis import ProteinAnalysisResult
+from functions.schemas.protein_analysis import (
+    ClusteringParameters,
+    ClusteringResponse,
+    DigestionParameters,
+    ProteinAnalysisResult,
+    VariantScanResponse,
+)
 from functions.services.protein_analyzers import ProteinAnalysisService
+from functions.services.variant_scan import VariantScanner
 
 # Create a global service instance (demonstrates encapsulation)
 _analysis_service = ProteinAnalysisService()
 
 
 def analyze_protein_sequences(
-    sequences: List[str], analysis_type: str = "basic"
+    sequences: List[str],
+    analysis_type: str = "basic",
+    digestion: Optional[DigestionParameters] = None,
 ) -> List[ProteinAnalysisResult]:
     """
     Analyze protein sequences using the OOP-based service.
 
     Args:
         sequences: List of protein sequences to analyze
-        analysis_type: Type of analysis to perform ('basic' or 'advanced')
+        analysis_type: Type of analysis to perform ('basic', 'advanced' or 'digest')
+        digestion: Digestion settings, used by 'digest' analysis
 
     Returns:
         List of analysis results
     """
-    return _analysis_service.analyze_sequences(sequences, analysis_type)
+    return _analysis_service.analyze_sequences(sequences, analysis_type, digestion)
+
+
+def stream_protein_sequences(
+    sequences: List[str],
+    analysis_type: str = "basic",
+    digestion: Optional[DigestionParameters] = None,
+) -> Iterator[ProteinAnalysisResult]:
+    """
+    Analyze protein sequences one at a time, for streaming responses.
+
+    Args:
+        sequences: List of protein sequences to analyze
+        analysis_type: Type of analysis to perform ('basic', 'advanced' or 'digest')
+        digestion: Digestion settings, used by 'digest' analysis
+
+    Returns:
+        Iterator over analysis results in input order
+    """
+    return _analysis_service.iter_analyze_sequences(
+        sequences, analysis_type, digestion
+    )
+
+
+def cluster_protein_sequences(
+    sequences: List[str],
+    parameters: Optional[ClusteringParameters] = None,
+    analysis_type: Optional[str] = None,
+    digestion: Optional[DigestionParameters] = None,
+) -> ClusteringResponse:
+    """
+    Cluster near-duplicate protein sequences using the OOP-based service.
+
+    Args:
+        sequences: List of protein sequences to cluster
+        parameters: Identity threshold, k-mer size and LSH banding
+        analysis_type: If set, analyze only the cluster representatives
+        digestion: Digestion settings, used by 'digest' analysis
+
+    Returns:
+        Cluster assignments, representatives and optional results
+    """
+    return _analysis_service.cluster_sequences(
+        sequences, parameters, analysis_type, digestion
+    )
+
+
+def analyze_protein_variants(
+    parent_sequence: str, variants: List[str]
+) -> VariantScanResponse:
+    """
+    Analyze point mutants of a parent sequence without re-analyzing each one.
+
+    Args:
+        parent_sequence: The parent protein sequence
+        variants: Mutations such as 'A123G', with '/' joining multiple mutations
+
+    Returns:
+        The parent analysis and the derived properties of each variant
+    """
+    scanner = VariantScanner(parent_sequence)
+    return VariantScanResponse(
+        parent=scanner.parent_result, variants=scanner.analyze_variants(variants)
+    )
 
 
 def get_analysis_service() -> ProteinAnalysisService:
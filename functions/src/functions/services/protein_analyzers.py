@@ -1,10 +1,18 @@
 import hashlib
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from Bio.SeqUtils.ProtParam import ProteinAnalysis as PA
 
-from functions.schemas.protein_analysis import ProteinAnalysisResult
+from functions.schemas.protein_analysis import (
+    ClusteringParameters,
+    ClusteringResponse,
+    DigestionAnalysisResult,
+    DigestionParameters,
+    ProteinAnalysisResult,
+)
+from functions.services.clustering import SequenceClusterer
+from functions.services.digestion import digest_sequence
 
 
 class BaseProteinAnalyzer(ABC):
@@ -213,6 +221,46 @@ class AdvancedProteinAnalyzer(BaseProteinAnalyzer):
         )
 
 
+class DigestionProteinAnalyzer(BaseProteinAnalyzer):
+    """
+    Protein analyzer that digests the sequence into a peptide map.
+    Demonstrates INHERITANCE from BaseProteinAnalyzer.
+    """
+
+    def __init__(self, sequence: str, parameters: Optional[DigestionParameters] = None):
+        """
+        Initialize the analyzer with a protein sequence and digestion settings.
+
+        Args:
+            sequence: The protein sequence to analyze
+            parameters: Enzyme, missed cleavages and peptide filters
+        """
+        super().__init__(sequence)
+        self._parameters = parameters or DigestionParameters()
+
+    def analyze(self) -> DigestionAnalysisResult:
+        """
+        Perform in-silico digestion alongside the basic properties.
+        Demonstrates POLYMORPHISM - different implementation of abstract method.
+        """
+        if not self.is_valid:
+            raise ValueError(
+                f"Cannot analyze invalid sequence: {'; '.join(self.validation_errors)}"
+            )
+
+        basic_props = self.get_basic_properties()
+
+        return DigestionAnalysisResult(
+            sequence=self._sequence,
+            length=int(basic_props["length"]),
+            molecular_weight=basic_props["molecular_weight"],
+            isoelectric_point=basic_props["isoelectric_point"],
+            amino_acid_counts=self._calculate_amino_acid_composition(),
+            amino_acid_percentages=self._calculate_amino_acid_percentages(),
+            peptides=digest_sequence(self._sequence, self._parameters),
+        )
+
+
 class ProteinAnalysisFactory:
     """
     Factory class for creating protein analyzers.
@@ -220,13 +268,18 @@ class ProteinAnalysisFactory:
     """
 
     @staticmethod
-    def create_analyzer(analysis_type: str, sequence: str) -> BaseProteinAnalyzer:
+    def create_analyzer(
+        analysis_type: str,
+        sequence: str,
+        digestion: Optional[DigestionParameters] = None,
+    ) -> BaseProteinAnalyzer:
         """
         Create a protein analyzer based on the analysis type.
 
         Args:
-            analysis_type: Type of analysis ('basic' or 'advanced')
+            analysis_type: Type of analysis ('basic', 'advanced' or 'digest')
             sequence: Protein sequence to analyze
+            digestion: Digestion settings, used by 'digest' analysis
 
         Returns:
             Appropriate analyzer instance
@@ -238,13 +291,15 @@ class ProteinAnalysisFactory:
             return BasicProteinAnalyzer(sequence)
         elif analysis_type.lower() == "advanced":
             return AdvancedProteinAnalyzer(sequence)
+        elif analysis_type.lower() == "digest":
+            return DigestionProteinAnalyzer(sequence, digestion)
         else:
             raise ValueError(f"Unsupported analysis type: {analysis_type}")
 
     @staticmethod
     def get_supported_types() -> List[str]:
         """Get list of supported analysis types."""
-        return ["basic", "advanced"]
+        return ["basic", "advanced", "digest"]
 
 
 class ProteinAnalysisService:
@@ -261,39 +316,52 @@ class ProteinAnalysisService:
         self._results_cache: Dict[str, ProteinAnalysisResult] = {}  # Encapsulated cache
         self._factory = ProteinAnalysisFactory()  # Encapsulated factory
 
-    def _generate_cache_key(self, sequence: str, analysis_type: str) -> str:
+    def _generate_cache_key(
+        self,
+        sequence: str,
+        analysis_type: str,
+        digestion: Optional[DigestionParameters] = None,
+    ) -> str:
         """
         Private method to generate cache key.
         Demonstrates ENCAPSULATION - internal caching logic.
         """
         sequence_hash = hashlib.sha1(sequence.encode()).hexdigest()
+        if analysis_type.lower() == "digest":
+            parameters = (digestion or DigestionParameters()).model_dump_json()
+            parameters_hash = hashlib.sha1(parameters.encode()).hexdigest()
+            return f"{analysis_type}_{parameters_hash}_{sequence_hash}"
         return f"{analysis_type}_{sequence_hash}"
 
-    def analyze_sequences(
-        self, sequences: List[str], analysis_type: str = "basic"
-    ) -> List[ProteinAnalysisResult]:
+    def iter_analyze_sequences(
+        self,
+        sequences: List[str],
+        analysis_type: str = "basic",
+        digestion: Optional[DigestionParameters] = None,
+    ) -> Iterator[ProteinAnalysisResult]:
         """
-        Analyze multiple protein sequences.
+        Analyze multiple protein sequences, yielding each result as it is ready.
 
         Args:
             sequences: List of protein sequences to analyze
             analysis_type: Type of analysis to perform
+            digestion: Digestion settings, used by 'digest' analysis
 
-        Returns:
-            List of analysis results
+        Yields:
+            Analysis results in input order
         """
-        results = []
-
         for sequence in sequences:
-            cache_key = self._generate_cache_key(sequence, analysis_type)
+            cache_key = self._generate_cache_key(sequence, analysis_type, digestion)
 
             # Check cache first
             if cache_key in self._results_cache:
-                results.append(self._results_cache[cache_key])
+                yield self._results_cache[cache_key]
                 continue
 
             # Create analyzer using factory (demonstrates polymorphism)
-            analyzer = self._factory.create_analyzer(analysis_type, sequence)
+            analyzer = self._factory.create_analyzer(
+                analysis_type, sequence, digestion
+            )
 
             # Store analyzer (demonstrates encapsulation)
             self._analyzers.append(analyzer)
@@ -303,9 +371,70 @@ class ProteinAnalysisService:
 
             # Cache result
             self._results_cache[cache_key] = result
-            results.append(result)
+            yield result
+
+    def analyze_sequences(
+        self,
+        sequences: List[str],
+        analysis_type: str = "basic",
+        digestion: Optional[DigestionParameters] = None,
+    ) -> List[ProteinAnalysisResult]:
+        """
+        Analyze multiple protein sequences.
+
+        Args:
+            sequences: List of protein sequences to analyze
+            analysis_type: Type of analysis to perform
+            digestion: Digestion settings, used by 'digest' analysis
+
+        Returns:
+            List of analysis results
+        """
+        return list(self.iter_analyze_sequences(sequences, analysis_type, digestion))
+
+    def cluster_sequences(
+        self,
+        sequences: List[str],
+        parameters: Optional[ClusteringParameters] = None,
+        analysis_type: Optional[str] = None,
+        digestion: Optional[DigestionParameters] = None,
+    ) -> ClusteringResponse:
+        """
+        Cluster near-duplicate sequences, optionally analyzing representatives.
+
+        Args:
+            sequences: List of protein sequences to cluster
+            parameters: Identity threshold, k-mer size and LSH banding
+            analysis_type: If set, analyze each cluster representative
+            digestion: Digestion settings, used by 'digest' analysis
+
+        Returns:
+            Cluster assignments, representatives and optional results
+
+        Raises:
+            ValueError: If a sequence is invalid
+        """
+        # Validate and normalize using the same rules as the analyzers
+        normalized = []
+        for sequence in sequences:
+            analyzer = self._factory.create_analyzer("basic", sequence)
+            if not analyzer.is_valid:
+                raise ValueError(
+                    f"Invalid sequence: {'; '.join(analyzer.validation_errors)}"
+                )
+            normalized.append(analyzer.sequence)
+
+        response = SequenceClusterer(parameters).cluster(normalized)
+
+        if analysis_type is not None:
+            representatives = [
+                sequences[cluster.representative] for cluster in response.clusters
+            ]
+            response.representative_results = self.analyze_sequences(
+                representatives, analysis_type, digestion
+            )
 
-        return results
+        return response
 
     def get_analyzer_count(self) -> int:
         """Get the number of analyzers created."""
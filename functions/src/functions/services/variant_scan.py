@@ -0,0 +1,179 @@
+import re
+from typing import Dict, List, Tuple
+
+from Bio.Data import IUPACData
+from Bio.SeqUtils import ProtParamData
+from Bio.SeqUtils.IsoelectricPoint import IsoelectricPoint
+
+from functions.schemas.protein_analysis import (
+    ProteinAnalysisResult,
+    VariantAnalysisResult,
+)
+from functions.services.protein_analyzers import ProteinAnalysisFactory
+
+_MUTATION_PATTERN = re.compile(r"^([A-Z])(\d+)([A-Z])$")
+_VALID_AA = set("ACDEFGHIKLMNPQRSTVWY")
+
+# Average residue masses match Bio.SeqUtils.molecular_weight, so swapping one
+# residue changes the weight by the difference of the free amino acid weights.
+_WEIGHTS = IUPACData.protein_weights
+_HYDROPATHY = ProtParamData.kd
+_DIWV = ProtParamData.DIWV
+
+# (zero-based position, wild-type residue, mutant residue)
+Mutation = Tuple[int, str, str]
+
+
+class VariantScanner:
+    """
+    Derives properties of point mutants from a single parent analysis.
+
+    The parent is analyzed once with the advanced analyzer. Each variant then
+    only touches the residues it changes: additive properties (composition,
+    molecular weight, GRAVY, aromaticity, extinction coefficients, secondary
+    structure fractions) are updated as O(1) deltas, the instability index only
+    rescores the dipeptides around each mutation, and the pI and charge are
+    re-solved from the updated charged-residue counts and termini.
+    """
+
+    def __init__(self, parent_sequence: str):
+        """
+        Initialize the scanner and analyze the parent sequence.
+
+        Args:
+            parent_sequence: The parent protein sequence
+
+        Raises:
+            ValueError: If the parent sequence is invalid
+        """
+        analyzer = ProteinAnalysisFactory.create_analyzer("advanced", parent_sequence)
+        self._parent_result = analyzer.analyze()
+        self._sequence = analyzer.sequence
+        self._length = len(self._sequence)
+
+        # Running sums that the per-variant deltas are applied to
+        self._parent_counts = self._parent_result.amino_acid_counts
+        self._hydropathy_sum = sum(_HYDROPATHY[aa] for aa in self._sequence)
+        self._instability_sum = sum(
+            _DIWV[self._sequence[i]][self._sequence[i + 1]]
+            for i in range(self._length - 1)
+        )
+
+    @property
+    def parent_result(self) -> ProteinAnalysisResult:
+        """Get the analysis result of the parent sequence."""
+        return self._parent_result
+
+    def parse_variant(self, variant: str) -> List[Mutation]:
+        """
+        Parse a variant such as 'A123G' or 'A123G/K45R' against the parent.
+
+        Positions are one-based and the wild-type residue must match the
+        parent sequence.
+
+        Raises:
+            ValueError: If the variant is malformed or does not match the parent
+        """
+        mutations: List[Mutation] = []
+        positions = set()
+
+        for token in variant.upper().split("/"):
+            match = _MUTATION_PATTERN.match(token.strip())
+            if match is None:
+                raise ValueError(f"Invalid mutation '{token}' in variant '{variant}'")
+
+            wild_type, position, mutant = match.groups()
+            position = int(position)
+            if not 1 <= position <= self._length:
+                raise ValueError(
+                    f"Mutation '{token}' is outside the parent sequence "
+                    f"(length {self._length})"
+                )
+            if self._sequence[position - 1] != wild_type:
+                raise ValueError(
+                    f"Mutation '{token}' does not match parent residue "
+                    f"'{self._sequence[position - 1]}' at position {position}"
+                )
+            if mutant not in _VALID_AA:
+                raise ValueError(f"Invalid amino acid character in mutation '{token}'")
+            if position in positions:
+                raise ValueError(
+                    f"Variant '{variant}' mutates position {position} more than once"
+                )
+
+            positions.add(position)
+            mutations.append((position - 1, wild_type, mutant))
+
+        return mutations
+
+    def _instability_delta(self, substitutions: Dict[int, str]) -> float:
+        """Rescore only the dipeptides overlapping a mutated position."""
+        sequence = self._sequence
+        affected = {
+            start
+            for position in substitutions
+            for start in (position - 1, position)
+            if 0 <= start < self._length - 1
+        }
+
+        delta = 0.0
+        for start in affected:
+            old = _DIWV[sequence[start]][sequence[start + 1]]
+            first = substitutions.get(start, sequence[start])
+            second = substitutions.get(start + 1, sequence[start + 1])
+            delta += _DIWV[first][second] - old
+        return delta
+
+    def analyze_variant(self, variant: str) -> VariantAnalysisResult:
+        """
+        Derive the properties of a single variant from the parent.
+
+        Raises:
+            ValueError: If the variant is malformed or does not match the parent
+        """
+        mutations = self.parse_variant(variant)
+        length = self._length
+        counts = dict(self._parent_counts)
+        molecular_weight = self._parent_result.molecular_weight
+        hydropathy_sum = self._hydropathy_sum
+
+        for _, wild_type, mutant in mutations:
+            counts[wild_type] -= 1
+            counts[mutant] += 1
+            molecular_weight += _WEIGHTS[mutant] - _WEIGHTS[wild_type]
+            hydropathy_sum += _HYDROPATHY[mutant] - _HYDROPATHY[wild_type]
+
+        substitutions = {position: mutant for position, _, mutant in mutations}
+        instability_sum = self._instability_sum + self._instability_delta(
+            substitutions
+        )
+
+        # The pI only depends on charged residue counts and the terminal residues
+        termini = substitutions.get(0, self._sequence[0]) + substitutions.get(
+            length - 1, self._sequence[-1]
+        )
+        charge = IsoelectricPoint(termini, counts)
+
+        extinction_reduced = counts["W"] * 5500 + counts["Y"] * 1490
+
+        return VariantAnalysisResult(
+            variant="/".join(f"{wt}{pos + 1}{mt}" for pos, wt, mt in mutations),
+            length=length,
+            molecular_weight=molecular_weight,
+            isoelectric_point=charge.pi(),
+            aromaticity=sum(counts[aa] for aa in "YWF") / length,
+            instability_index=(10.0 / length) * instability_sum,
+            gravy=hydropathy_sum / length,
+            helix_fraction=sum(counts[aa] for aa in "EMALK") / length,
+            turn_fraction=sum(counts[aa] for aa in "NPGSD") / length,
+            sheet_fraction=sum(counts[aa] for aa in "VIYFWLT") / length,
+            extinction_coeff_reduced=extinction_reduced,
+            extinction_coeff_oxidized=extinction_reduced + (counts["C"] // 2) * 125,
+            charge_at_ph7=charge.charge_at_pH(7.0),
+            amino_acid_counts=counts,
+            amino_acid_percentages={aa: count / length for aa, count in counts.items()},
+        )
+
+    def analyze_variants(self, variants: List[str]) -> List[VariantAnalysisResult]:
+        """Derive the properties of each variant from the parent."""
+        return [self.analyze_variant(variant) for variant in variants]
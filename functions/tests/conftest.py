@@ -0,0 +1,17 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from functions.api.deps import get_current_user
+from functions.main import app
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def authenticated_user():
+    app.dependency_overrides[get_current_user] = lambda: "test-user"
+    yield
+    app.dependency_overrides.clear()
@@ -0,0 +1,98 @@
+import csv
+import json
+
+import pytest
+
+from functions.cli import main
+
+FASTA = """>p1 first protein
+MKTAYIAKQRQISFVKSHFSRQ
+>p2 second protein
+ACDEFGHIKLMNPQRSTVWY
+>bad invalid residues
+MKXZ
+>p3 third protein
+GGGSSSAAA
+>p4 fourth protein
+MALWMRLLPLLALLALWGPDPAAA
+"""
+
+
+def _read_rows(output_dir):
+    rows = []
+    for path in sorted(output_dir.glob("part-*.csv")):
+        with open(path, newline="") as handle:
+            rows.extend(csv.DictReader(handle))
+    return rows
+
+
+def test_cli_writes_chunked_csv(tmp_path):
+    """
+    Test that every record is written across chunked part files, with
+    invalid sequences reported in the error column.
+    """
+    fasta = tmp_path / "input.fasta"
+    fasta.write_text(FASTA)
+    output_dir = tmp_path / "out"
+
+    exit_code = main(
+        [str(fasta), str(output_dir), "--chunk-size", "2", "--workers", "1", "--quiet"]
+    )
+
+    assert exit_code == 0
+    assert len(list(output_dir.glob("part-*.csv"))) == 3
+    rows = _read_rows(output_dir)
+    assert [row["id"] for row in rows] == ["p1", "p2", "bad", "p3", "p4"]
+    assert rows[1]["count_A"] == "1"
+    assert "Invalid amino acid characters" in rows[2]["error"]
+
+    checkpoint = json.loads((output_dir / "_checkpoint.json").read_text())
+    assert checkpoint["completed"] == [0, 1, 2]
+    assert checkpoint["analyzed"] == 4
+    assert checkpoint["failed"] == 1
+
+
+def test_cli_resumes_from_checkpoint(tmp_path):
+    """
+    Test that a resumed run only processes chunks missing from the checkpoint,
+    and that an existing checkpoint is not overwritten without --resume.
+    """
+    fasta = tmp_path / "input.fasta"
+    fasta.write_text(FASTA)
+    output_dir = tmp_path / "out"
+    args = [str(fasta), str(output_dir), "--chunk-size", "2", "--quiet"]
+
+    assert main(args + ["--workers", "1"]) == 0
+    assert main(args + ["--workers", "1"]) == 1
+
+    # Simulate an interruption after the first chunk
+    (output_dir / "part-000001.csv").unlink()
+    (output_dir / "part-000002.csv").unlink()
+    checkpoint_path = output_dir / "_checkpoint.json"
+    checkpoint = json.loads(checkpoint_path.read_text())
+    checkpoint.update(completed=[0], analyzed=2, failed=0)
+    checkpoint_path.write_text(json.dumps(checkpoint))
+
+    assert main(args + ["--workers", "2", "--resume"]) == 0
+    assert [row["id"] for row in _read_rows(output_dir)] == [
+        "p1",
+        "p2",
+        "bad",
+        "p3",
+        "p4",
+    ]
+    checkpoint = json.loads(checkpoint_path.read_text())
+    assert checkpoint["completed"] == [0, 1, 2]
+    assert checkpoint["analyzed"] == 4
+
+
+def test_cli_rejects_digest_analysis(tmp_path):
+    """
+    Test that digestion, whose peptides have no output columns, is not offered.
+    """
+    fasta = tmp_path / "input.fasta"
+    fasta.write_text(FASTA)
+
+    with pytest.raises(SystemExit) as exc_info:
+        main([str(fasta), str(tmp_path / "out"), "--analysis-type", "digest"])
+    assert exc_info.value.code == 2
@@ -0,0 +1,165 @@
+import random
+
+import numpy as np
+import pytest
+
+from functions.schemas.protein_analysis import ClusteringParameters
+from functions.services.clustering import _PRIME, SequenceClusterer
+from functions.services.protein_analyzers import ProteinAnalysisService
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def _random_sequence(rng, length):
+    return "".join(rng.choice(AMINO_ACIDS) for _ in range(length))
+
+
+def _mutate(rng, sequence, substitutions):
+    residues = list(sequence)
+    for position in rng.sample(range(len(residues)), substitutions):
+        residues[position] = rng.choice(AMINO_ACIDS.replace(residues[position], ""))
+    return "".join(residues)
+
+
+def test_near_duplicates_cluster_together():
+    """
+    Test that variants of the same family share a cluster, unrelated families
+    stay apart, and the longest member becomes the representative.
+    """
+    rng = random.Random(0)
+    family_a = _random_sequence(rng, 200)
+    family_b = _random_sequence(rng, 150)
+    sequences = [
+        _mutate(rng, family_a, 4),
+        family_b,
+        family_a,
+        _mutate(rng, family_b, 6),
+        family_a[:180],
+        _random_sequence(rng, 120),
+    ]
+
+    response = SequenceClusterer(ClusteringParameters(identity_threshold=0.9)).cluster(
+        sequences
+    )
+
+    assert len(response.clusters) == 3
+    assignments = response.assignments
+    assert assignments[0] == assignments[2] == assignments[4]
+    assert assignments[1] == assignments[3]
+    assert len({assignments[0], assignments[1], assignments[5]}) == 3
+    assert sorted(
+        index for cluster in response.clusters for index in cluster.members
+    ) == list(range(len(sequences)))
+
+    representative = response.clusters[assignments[0]].representative
+    assert len(sequences[representative]) == 200
+
+
+def test_identity_threshold_splits_distant_variants():
+    """
+    Test that a variant below the identity threshold forms its own cluster.
+    """
+    rng = random.Random(1)
+    parent = _random_sequence(rng, 100)
+    distant = _mutate(rng, parent, 20)
+
+    clusterer = SequenceClusterer(ClusteringParameters(identity_threshold=0.95))
+    assert clusterer.identity(parent, distant) < 0.95
+    assert clusterer.cluster([parent, distant]).assignments == [0, 1]
+
+
+@pytest.mark.parametrize("threshold", [0.6, 0.7])
+def test_half_shared_sequences_stay_apart(threshold):
+    """
+    Test that sequences sharing only half their residues are not merged, since
+    unrelated stretches must not be gapped into spurious matches.
+    """
+    rng = random.Random(2)
+    shared = _random_sequence(rng, 100)
+    first = shared + _random_sequence(rng, 100)
+    second = shared + _random_sequence(rng, 100)
+
+    clusterer = SequenceClusterer(ClusteringParameters(identity_threshold=threshold))
+    assert clusterer.identity(first, second) < threshold
+    assert clusterer.cluster([first, second]).assignments == [0, 1]
+
+
+def test_sketch_is_computed_in_bounded_blocks():
+    """
+    Test that blocked sketching at the largest banding matches hashing every
+    k-mer at once.
+    """
+    rng = random.Random(3)
+    sequence = _random_sequence(rng, 3000)
+    clusterer = SequenceClusterer(ClusteringParameters(bands=128, rows_per_band=16))
+
+    codes = np.unique(clusterer._kmer_codes(sequence, 3))
+    expected = ((clusterer._hash_a * codes + clusterer._hash_b) % _PRIME).min(axis=1)
+    assert np.array_equal(clusterer.sketch(sequence), expected)
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.8, 0.9, 1.0])
+def test_bounds_agree_with_alignment(threshold):
+    """
+    Test that the cheap bounds never contradict a full alignment for variants
+    with substitutions, insertions, deletions and truncations.
+    """
+    rng = random.Random(5)
+    clusterer = SequenceClusterer(ClusteringParameters(identity_threshold=threshold))
+    for _ in range(40):
+        parent = _random_sequence(rng, rng.randint(20, 300))
+        start, end = sorted(rng.sample(range(len(parent)), 2))
+        insertion = _random_sequence(rng, rng.randint(1, 10))
+        for variant in (
+            _mutate(rng, parent, rng.randint(0, len(parent) // 3)),
+            parent[:start] + insertion + parent[start:end] + insertion + parent[end:],
+            _mutate(rng, parent[:start] + parent[end:], 1),
+            _mutate(rng, parent[start:end], 1),
+        ):
+            expected = clusterer.identity(parent, variant) >= threshold
+            assert clusterer.matches(parent, variant) == expected
+
+
+def test_long_pairs_are_decided_without_full_alignment(monkeypatch):
+    """
+    Test that long isoforms and unrelated long sequences are decided by the
+    cheap bounds, without a quadratic alignment.
+    """
+    rng = random.Random(4)
+    parent = _random_sequence(rng, 35_000)
+    isoform = _mutate(rng, parent[:10_000] + parent[10_060:], 1)
+    unrelated = _random_sequence(rng, 35_000)
+
+    clusterer = SequenceClusterer()
+
+    def fail_to_align(first, second):
+        raise AssertionError("pair was aligned in full")
+
+    monkeypatch.setattr(clusterer, "identity", fail_to_align)
+    assert clusterer.matches(parent, isoform)
+    assert not clusterer.matches(parent, unrelated)
+    assert clusterer.cluster([unrelated, isoform, parent]).assignments == [0, 1, 1]
+
+
+def test_service_analyzes_only_representatives():
+    """
+    Test that the service clusters, then analyzes one sequence per cluster.
+    """
+    sequences = [
+        "MKTAYIAKQRQISFVKSHFSRQ",
+        "mktayiakqrqisfvkshfsrq",
+        "ACDEFGHIKLMNPQRSTVWY",
+    ]
+    service = ProteinAnalysisService()
+
+    response = service.cluster_sequences(sequences, analysis_type="basic")
+
+    assert response.assignments == [0, 0, 1]
+    assert [r.sequence for r in response.representative_results] == [
+        "MKTAYIAKQRQISFVKSHFSRQ",
+        "ACDEFGHIKLMNPQRSTVWY",
+    ]
+    assert service.get_analyzer_count() == 2
+
+    with pytest.raises(ValueError):
+        service.cluster_sequences(["MKTAYIAK", "MKX"])
@@ -0,0 +1,136 @@
+import logging
+
+import pytest
+from pydantic import ValidationError
+
+from functions.core import compression
+from functions.core.compression import select_encoding
+from functions.core.config import Settings
+
+SEQUENCES = ["MKTAYIAKQRQISFVKSHFSRQ", "ACDEFGHIKLMNPQRSTVWY"] * 20
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("gzip", "gzip"),
+        ("zstd;q=0.5, gzip", "gzip"),
+        ("zstd;q=0, gzip;q=0", None),
+        ("*", "zstd"),
+        ("br", None),
+        ("", None),
+    ],
+)
+def test_select_encoding(accept_encoding, expected):
+    """
+    Test that the coding is negotiated from quality values and server
+    preference.
+    """
+    assert select_encoding(accept_encoding) == expected
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+def test_analysis_response_is_compressed(client, authenticated_user, encoding):
+    """
+    Test that large analysis responses are compressed with the negotiated
+    coding and decompress to the uncompressed response.
+    """
+    uncompressed = client.post(
+        "/api/v1/analyze",
+        json={"sequences": SEQUENCES},
+        headers={"accept-encoding": "identity"},
+    )
+    response = client.post(
+        "/api/v1/analyze",
+        json={"sequences": SEQUENCES},
+        headers={"accept-encoding": encoding},
+    )
+
+    assert response.headers["content-encoding"] == encoding
+    assert "accept-encoding" in response.headers["vary"].lower()
+    assert int(response.headers["content-length"]) < len(uncompressed.content)
+    # The test client decodes both codings
+    assert response.json() == uncompressed.json()
+
+
+def test_streamed_response_is_compressed(client, authenticated_user):
+    """
+    Test that NDJSON streams are compressed without a fixed content length.
+    """
+    response = client.post(
+        "/api/v1/analyze/stream",
+        json={"sequences": SEQUENCES},
+        headers={"accept-encoding": "gzip"},
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    lines = response.text.strip().split("\n")
+    assert len(lines) == len(SEQUENCES)
+
+
+def test_small_and_unrelated_responses_are_not_compressed(client, authenticated_user):
+    """
+    Test that payloads under the minimum size and paths outside the analysis
+    endpoints are sent uncompressed.
+    """
+    small = client.post(
+        "/api/v1/analyze/variants",
+        json={"parent_sequence": "MKTAYIAK", "variants": ["G4A"]},
+        headers={"accept-encoding": "gzip"},
+    )
+    assert small.status_code == 400
+    assert "content-encoding" not in small.headers
+
+    health = client.get("/api/v1/health", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in health.headers
+
+
+def test_compression_sizes_are_logged(client, authenticated_user, caplog):
+    """
+    Test that byte counts are logged without any logging setup by the caller.
+    """
+    client.post(
+        "/api/v1/analyze",
+        json={"sequences": SEQUENCES},
+        headers={"accept-encoding": "gzip"},
+    )
+
+    assert any(
+        record.name == "functions.core.compression"
+        and record.message.startswith("Compressed gzip response for /api/v1/analyze")
+        for record in caplog.records
+    )
+
+
+def test_compression_logging_has_a_handler(monkeypatch):
+    """
+    Test that the configured level is applied and that records still reach a
+    handler when none is configured anywhere.
+    """
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    monkeypatch.setattr(compression.logger, "handlers", [])
+    monkeypatch.setattr(compression.logger, "level", logging.NOTSET)
+
+    compression.configure_compression_logging("DEBUG")
+
+    assert compression.logger.level == logging.DEBUG
+    assert len(compression.logger.handlers) == 1
+
+
+@pytest.mark.parametrize(
+    "setting, value",
+    [
+        ("GZIP_COMPRESSION_LEVEL", 10),
+        ("GZIP_COMPRESSION_LEVEL", -1),
+        ("ZSTD_COMPRESSION_LEVEL", 23),
+        ("COMPRESSION_LOG_LEVEL", "VERBOSE"),
+    ],
+)
+def test_invalid_compression_settings_are_rejected(setting, value):
+    """
+    Test that out-of-range compression settings fail when settings load.
+    """
+    with pytest.raises(ValidationError):
+        Settings(**{setting: value})
@@ -0,0 +1,104 @@
+import pytest
+from Bio.SeqUtils import molecular_weight
+
+from functions.schemas.protein_analysis import DigestionParameters
+from functions.services.digestion import digest_sequence, find_cleavage_sites
+from functions.services.protein_analyzers import ProteinAnalysisService
+
+SEQUENCE = "MKWVTFISLLFLFSSAYSRGVFRRDAHKSEVAHRFKDLGEENFKALVLIAFAQYLQQCPFE"
+
+
+def _peptide_sequences(sequence, peptides):
+    return [sequence[p.start - 1 : p.end] for p in peptides]
+
+
+def test_cleavage_sites_follow_enzyme_rules():
+    """
+    Test that trypsin skips K/R followed by proline, while Lys-C and Glu-C
+    cut after every K or E.
+    """
+    assert find_cleavage_sites("AKPARGK", "trypsin") == [0, 5, 7]
+    assert find_cleavage_sites("AKPARGK", "lys-c") == [0, 2, 7]
+    assert find_cleavage_sites("AEEGA", "glu-c") == [0, 2, 3, 5]
+
+
+def test_peptide_masses_match_full_computation():
+    """
+    Test that prefix-sum masses agree with computing each peptide's mass
+    from its sequence.
+    """
+    parameters = DigestionParameters(missed_cleavages=2, min_length=1)
+    peptides = digest_sequence(SEQUENCE, parameters)
+
+    assert peptides
+    for peptide, sequence in zip(peptides, _peptide_sequences(SEQUENCE, peptides)):
+        assert peptide.monoisotopic_mass == pytest.approx(
+            molecular_weight(sequence, seq_type="protein", monoisotopic=True)
+        )
+        assert peptide.average_mass == pytest.approx(
+            molecular_weight(sequence, seq_type="protein")
+        )
+
+
+def test_missed_cleavages_and_filters():
+    """
+    Test that missed cleavages join neighbouring peptides and that the length
+    and mass filters bound the output.
+    """
+    no_missed = digest_sequence(
+        "AAAKGGGRCCCK", DigestionParameters(missed_cleavages=0, min_length=1)
+    )
+    assert _peptide_sequences("AAAKGGGRCCCK", no_missed) == ["AAAK", "GGGR", "CCCK"]
+
+    one_missed = digest_sequence(
+        "AAAKGGGRCCCK", DigestionParameters(missed_cleavages=1, min_length=1)
+    )
+    assert _peptide_sequences("AAAKGGGRCCCK", one_missed) == [
+        "AAAK",
+        "AAAKGGGR",
+        "GGGR",
+        "GGGRCCCK",
+        "CCCK",
+    ]
+    assert [p.missed_cleavages for p in one_missed] == [0, 1, 0, 1, 0]
+
+    filtered = digest_sequence(
+        SEQUENCE,
+        DigestionParameters(
+            missed_cleavages=2, min_length=6, max_length=20, min_mass=800, max_mass=2000
+        ),
+    )
+    assert filtered
+    for peptide in filtered:
+        assert 6 <= peptide.end - peptide.start + 1 <= 20
+        assert 800 <= peptide.monoisotopic_mass <= 2000
+
+
+def test_digest_analysis_type_through_service():
+    """
+    Test that 'digest' is available through the factory and that results are
+    cached separately per digestion setting.
+    """
+    service = ProteinAnalysisService()
+    trypsin = service.analyze_sequences([SEQUENCE], "digest")
+    glu_c = service.analyze_sequences(
+        [SEQUENCE], "digest", DigestionParameters(enzyme="glu-c")
+    )
+
+    assert trypsin[0].peptides != glu_c[0].peptides
+    assert trypsin[0].molecular_weight == glu_c[0].molecular_weight
+    assert service.get_cache_size() == 2
+
+
+def test_only_digest_results_carry_peptides(client, authenticated_user):
+    """
+    Test that peptides appear in digest responses and are absent, not null,
+    in other analysis types.
+    """
+    basic = client.post("/api/v1/analyze", json={"sequences": [SEQUENCE]})
+    digest = client.post(
+        "/api/v1/analyze", json={"sequences": [SEQUENCE], "analysis_type": "digest"}
+    )
+
+    assert "peptides" not in basic.json()["results"][0]
+    assert digest.json()["results"][0]["peptides"]
@@ -0,0 +1,100 @@
+import pytest
+
+from functions.api import ingestion
+from functions.core.config import settings
+
+
+def test_bulk_matches_regular_endpoint(client, authenticated_user):
+    """
+    Test that the fast ingestion endpoint returns the same results as the
+    regular endpoint for a valid body.
+    """
+    body = {
+        "sequences": ["MKTAYIAKQRQISFVKSHFSRQ", "ACDEFGHIKLMNPQRSTVWY"],
+        "analysis_type": "digest",
+        "digestion": {"enzyme": "lys-c", "min_length": 2},
+    }
+
+    regular = client.post("/api/v1/analyze", json=body)
+    bulk = client.post("/api/v1/analyze/bulk", json=body)
+
+    assert bulk.status_code == 200
+    assert bulk.json() == regular.json()
+
+
+@pytest.mark.parametrize(
+    "content, headers",
+    [
+        ('{"sequences": ["MKT", 5]}', {"content-type": "application/json"}),
+        ('{"analysis_type": "basic"}', {"content-type": "application/json"}),
+        ('{"sequences": ["MKT"], "digestion": {"enzyme": "pepsin"}}', {}),
+        ('["MKT"]', {"content-type": "application/json"}),
+        ('{"sequences": [', {"content-type": "application/json"}),
+        ('{"sequences": ["MKT"]}', {"content-type": "text/plain"}),
+        ("", {"content-type": "application/json"}),
+    ],
+)
+def test_bulk_validation_errors_match_regular_endpoint(
+    client, authenticated_user, content, headers
+):
+    """
+    Test that invalid bodies get the same 422 responses on both endpoints.
+    """
+    regular = client.post("/api/v1/analyze", content=content, headers=headers)
+    bulk = client.post("/api/v1/analyze/bulk", content=content, headers=headers)
+
+    assert regular.status_code == 422
+    assert bulk.status_code == 422
+    assert bulk.json() == regular.json()
+
+
+@pytest.mark.parametrize("body", [{"sequences": ["MKT"]}, {"sequences": ["MKT", 5]}])
+def test_bulk_authenticates_before_parsing(client, body):
+    """
+    Test that unauthenticated requests are rejected like on the regular
+    endpoint, whether or not the body is valid.
+    """
+    regular = client.post("/api/v1/analyze", json=body)
+    bulk = client.post("/api/v1/analyze/bulk", json=body)
+
+    assert regular.status_code == 403
+    assert bulk.status_code == 403
+    assert bulk.json() == regular.json()
+
+
+def test_bulk_enforces_limits(client, authenticated_user, monkeypatch):
+    """
+    Test that oversized bodies and sequence counts are rejected with 413.
+    """
+    monkeypatch.setattr(settings, "MAX_SEQUENCES_PER_REQUEST", 2)
+    response = client.post(
+        "/api/v1/analyze/bulk", json={"sequences": ["MKT", "MKT", "MKT"]}
+    )
+    assert response.status_code == 413
+
+    monkeypatch.setattr(settings, "MAX_REQUEST_BYTES", 16)
+    response = client.post("/api/v1/analyze/bulk", json={"sequences": ["MKTAYIAKQR"]})
+    assert response.status_code == 413
+
+
+def test_bulk_counts_sequences_before_decoding(client, authenticated_user, monkeypatch):
+    """
+    Test that the sequence limit is enforced on the raw body, before any
+    sequence is decoded, while sizes at the limit are still accepted.
+    """
+    sequences = ["MKTAYIAK"] * 998 + ['M"K', 5]
+    monkeypatch.setattr(settings, "MAX_SEQUENCES_PER_REQUEST", len(sequences) - 1)
+
+    def fail_to_decode(body):
+        raise AssertionError("body was decoded")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(ingestion.orjson, "loads", fail_to_decode)
+        response = client.post(
+            "/api/v1/analyze/bulk", json={"sequences": sequences, "digestion": None}
+        )
+    assert response.status_code == 413
+
+    monkeypatch.setattr(settings, "MAX_SEQUENCES_PER_REQUEST", len(sequences))
+    response = client.post("/api/v1/analyze/bulk", json={"sequences": sequences})
+    assert response.status_code == 422
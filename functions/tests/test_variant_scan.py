@@ -0,0 +1,62 @@
+import pytest
+
+from functions.services.protein_analyzers import AdvancedProteinAnalyzer
+from functions.services.variant_scan import VariantScanner
+
+PARENT = "MKTAYIAKQRQISFVKSHFSRQLEERLGLIEVQC"
+
+
+def _mutate(sequence, variant):
+    residues = list(sequence)
+    for mutation in variant.split("/"):
+        residues[int(mutation[1:-1]) - 1] = mutation[-1]
+    return "".join(residues)
+
+
+@pytest.mark.parametrize(
+    "variant",
+    ["A4G", "M1A", "C34W", "K2E/T3P", "Y5W/I6C/Q33D", "M1S/C34E"],
+)
+def test_variant_matches_full_analysis(variant):
+    """
+    Test that properties derived from the parent match a full analysis of
+    the mutated sequence, including mutations at the termini.
+    """
+    scanner = VariantScanner(PARENT)
+    derived = scanner.analyze_variant(variant)
+    expected = AdvancedProteinAnalyzer(_mutate(PARENT, variant)).analyze()
+
+    assert derived.variant == variant
+    for field in (
+        "length",
+        "molecular_weight",
+        "isoelectric_point",
+        "aromaticity",
+        "instability_index",
+        "gravy",
+        "helix_fraction",
+        "turn_fraction",
+        "sheet_fraction",
+        "extinction_coeff_reduced",
+        "extinction_coeff_oxidized",
+        "charge_at_ph7",
+    ):
+        assert getattr(derived, field) == pytest.approx(getattr(expected, field))
+    assert derived.amino_acid_counts == expected.amino_acid_counts
+    assert derived.amino_acid_percentages == pytest.approx(
+        expected.amino_acid_percentages
+    )
+
+
+@pytest.mark.parametrize(
+    "variant",
+    ["G4A", "A99G", "A4X", "A4", "A4G/A4C"],
+)
+def test_invalid_variant_raises(variant):
+    """
+    Test that mismatched, out-of-range, malformed and repeated mutations are
+    rejected.
+    """
+    scanner = VariantScanner(PARENT)
+    with pytest.raises(ValueError):
+        scanner.analyze_variant(variant)